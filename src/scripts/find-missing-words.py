@@ -7,17 +7,45 @@ Uses multiple sources to find potentially missing words:
 2. Pattern-based generation - Common word patterns
 3. Category-based search - Animals, foods, verbs, etc.
 
+Requirements:
+- pip install aiohttp tenacity
+- pip install orjson (optional - faster JSON decoding of API responses)
+
+Datamuse responses are cached in src/data/.datamuse_cache for 30 days, so
+reruns only hit the network for new queries.
+
 Usage:
     python3 src/scripts/find-missing-words.py
+    python3 src/scripts/find-missing-words.py --refresh   # ignore cached responses
 """
 
 import re
-import json
-import urllib.request
-import urllib.parse
 import time
+import shelve
+import asyncio
+import hashlib
+import argparse
+import urllib.parse
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Set, List, Dict
+from typing import Set, List, Dict, Optional, Iterator
+
+import aiohttp
+from tenacity import (
+    retry,
+    retry_if_exception_type,
+    retry_if_result,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # Optional; stdlib json also accepts bytes
+    import json
+    json_loads = json.loads
 
 # ============================================================================
 # CONFIGURATION
@@ -27,18 +55,34 @@ SCRIPT_DIR = Path(__file__).parent
 DATA_DIR = SCRIPT_DIR.parent / 'data'
 WORD_LIST_FILE = DATA_DIR / 'guess_words_clean.ts'
 OUTPUT_FILE = DATA_DIR / 'missing_candidates.ts'
+CACHE_FILE = DATA_DIR / '.datamuse_cache'
+
+# Cached Datamuse responses older than this are refetched
+CACHE_TTL_SECONDS = 30 * 24 * 60 * 60
 
 # Datamuse API (free, no auth required)
 DATAMUSE_API = "https://api.datamuse.com/words"
 
+# In-flight Datamuse requests - adapted at runtime (AIMD) since the quota is unpublished
+DATAMUSE_CONCURRENCY_START = 4
+DATAMUSE_CONCURRENCY_MIN = 1
+DATAMUSE_CONCURRENCY_MAX = 32
+
+# Longest wait between retries - caps both the backoff and a Retry-After header
+DATAMUSE_RETRY_WAIT_MAX = 30
+
 # ============================================================================
 # LOAD CURRENT WORD LIST
 # ============================================================================
 
+WORD_RE = re.compile(r'"([A-Z]{5})"')
+
 def load_current_words() -> Set[str]:
-    """Load all words from our current word list"""
-    content = WORD_LIST_FILE.read_text()
-    words = set(re.findall(r'"([A-Z]{5})"', content))
+    """Load all words from our current word list (streamed line by line)"""
+    words = set()
+    with WORD_LIST_FILE.open('r', encoding='utf-8') as f:
+        for line in f:
+            words.update(WORD_RE.findall(line))
     print(f"Loaded {len(words)} words from current word list")
     return words
 
@@ -46,42 +90,215 @@ def load_current_words() -> Set[str]:
 # DATAMUSE API HELPERS
 # ============================================================================
 
-def query_datamuse(params: Dict) -> List[str]:
-    """Query Datamuse API and return 5-letter words"""
-    params['max'] = 1000  # Get many results
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit (as in TCP congestion control).
+
+    Each successful request grows the limit by alpha; each throttled or
+    failed request multiplies it by beta. The semaphore is resized lazily:
+    growth releases extra tokens, shrinkage is recorded as debt that is
+    paid off by swallowing tokens as in-flight requests finish.
+    """
+
+    def __init__(self, c: float = DATAMUSE_CONCURRENCY_START,
+                 c_min: float = DATAMUSE_CONCURRENCY_MIN,
+                 c_max: float = DATAMUSE_CONCURRENCY_MAX,
+                 alpha: float = 0.5, beta: float = 0.5):
+        self.c = float(c)
+        self.c_min = c_min
+        self.c_max = c_max
+        self.alpha = alpha
+        self.beta = beta
+        self._capacity = int(self.c)
+        self._debt = 0
+        self._semaphore = asyncio.Semaphore(self._capacity)
+
+    async def acquire(self) -> None:
+        await self._semaphore.acquire()
+
+    def release(self, success: bool) -> None:
+        if success:
+            self.c = min(self.c_max, self.c + self.alpha)
+        else:
+            self.c = max(self.c_min, self.c * self.beta)
+
+        delta = int(self.c) - self._capacity
+        self._capacity += delta
+
+        # Return our own token plus any growth, minus outstanding debt
+        tokens = 1 + max(delta, 0)
+        self._debt += max(-delta, 0)
+        paid = min(tokens, self._debt)
+        self._debt -= paid
+        for _ in range(tokens - paid):
+            self._semaphore.release()
+
+DATAMUSE_LIMITER = AdaptiveLimiter()
+
+class DatamuseCache:
+    """
+    On-disk Datamuse responses: sha1(url) -> (fetched_at, words).
+
+    Entries older than CACHE_TTL_SECONDS are treated as missing; with
+    refresh=True every read misses, so all queries are refetched (and
+    re-stored).
+    """
+
+    def __init__(self, shelf: shelve.Shelf, refresh: bool = False):
+        self.shelf = shelf
+        self.refresh = refresh
+
+    @staticmethod
+    def key(url: str) -> str:
+        return hashlib.sha1(url.encode()).hexdigest()
+
+    def get(self, url: str) -> Optional[List[str]]:
+        if self.refresh:
+            return None
+        entry = self.shelf.get(self.key(url))
+        if entry is None:
+            return None
+        fetched_at, words = entry
+        if time.time() - fetched_at >= CACHE_TTL_SECONDS:
+            return None
+        return words
+
+    def put(self, url: str, words: List[str]) -> None:
+        self.shelf[self.key(url)] = (time.time(), words)
+
+class RateLimited(Exception):
+    """Datamuse answered HTTP 429 - raised so the request is retried after retry_after"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+def parse_retry_after(value: Optional[str]) -> float:
+    """
+    Seconds to wait from a Retry-After header (0 if missing or not numeric),
+    capped at DATAMUSE_RETRY_WAIT_MAX
+    """
+    try:
+        return min(DATAMUSE_RETRY_WAIT_MAX, max(0.0, float(value)))
+    except (TypeError, ValueError):
+        return 0.0
+
+class DatamuseRejected(Exception):
+    """Datamuse answered a non-429 4xx - permanent, so neither retried nor cached"""
+
+DATAMUSE_BACKOFF = wait_exponential_jitter(initial=0.5, max=DATAMUSE_RETRY_WAIT_MAX)
+
+def wait_for_datamuse(retry_state) -> float:
+    """
+    Delay before the next attempt: the server's Retry-After on 429, otherwise
+    (or if the 429 carried no usable Retry-After) exponential backoff with jitter
+    """
+    error = retry_state.outcome.exception()
+    if isinstance(error, RateLimited) and error.retry_after > 0:
+        return error.retry_after
+    return DATAMUSE_BACKOFF(retry_state)
+
+def give_up_on_datamuse(retry_state) -> None:
+    """Called once retries are exhausted - log and signal failure with None"""
+    error = retry_state.outcome.exception() or 'server error or invalid payload'
+    print(f"  API error (gave up after {retry_state.attempt_number} attempts): {error}")
+    return None
+
+@retry(
+    retry=(
+        retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError, RateLimited))
+        | retry_if_result(lambda r: r is None)
+    ),
+    wait=wait_for_datamuse,
+    stop=stop_after_attempt(5),
+    retry_error_callback=give_up_on_datamuse,
+)
+async def fetch_datamuse(session: aiohttp.ClientSession, url: str) -> Optional[List[str]]:
+    """
+    Fetch one Datamuse URL and return 5-letter words.
+
+    Returns None on 5xx or a payload that isn't a JSON list (retried), raises
+    DatamuseRejected on other 4xx (permanent, not retried) and RateLimited on
+    429 so tenacity waits out Retry-After. Items without a "word" key are skipped.
+    """
+    # Anything other than 429/5xx/network error counts as success for AIMD
+    success = False
+    await DATAMUSE_LIMITER.acquire()
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status == 429:
+                # Raised inside the limiter block, so the slot is freed before the wait
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                raise RateLimited(f"HTTP 429 for {url}", retry_after)
+            elif response.status >= 500:
+                return None
+            elif response.status >= 400:
+                success = True
+                raise DatamuseRejected(f"HTTP {response.status} for {url}")
+            else:
+                # No content-type check here (unlike response.json()), so an
+                # HTML/error body on a 200 surfaces as a decode error -
+                # ValueError covers both orjson and stdlib JSONDecodeError
+                try:
+                    data = json_loads(await response.read())
+                except ValueError:
+                    return None
+                if not isinstance(data, list):
+                    return None
+                success = True
+                # Filter to exactly 5 letters, alphabetic only
+                words = (item.get('word', '') for item in data if isinstance(item, dict))
+                return [
+                    word.upper()
+                    for word in words
+                    if isinstance(word, str) and len(word) == 5 and word.isalpha()
+                ]
+    finally:
+        DATAMUSE_LIMITER.release(success)
+
+async def query_datamuse(session: aiohttp.ClientSession, cache: DatamuseCache, params: Dict) -> Iterator[str]:
+    """
+    Query Datamuse API and lazily yield valid 5-letter candidates.
+
+    Raw results are cached; is_valid_candidate is applied on the way out so
+    edits to the reject lists take effect without refetching.
+    """
+    params = {**params, 'max': 1000}  # Get many results
     url = f"{DATAMUSE_API}?{urllib.parse.urlencode(params)}"
 
+    words = cache.get(url)
+    if words is not None:
+        return filter(is_valid_candidate, words)
+
+    # Only successful fetches are cached - failures are logged and retried next run
     try:
-        with urllib.request.urlopen(url, timeout=10) as response:
-            data = json.loads(response.read().decode())
-            # Filter to exactly 5 letters, alphabetic only
-            words = [
-                item['word'].upper()
-                for item in data
-                if len(item['word']) == 5 and item['word'].isalpha()
-            ]
-            return words
-    except Exception as e:
+        words = await fetch_datamuse(session, url)
+    except DatamuseRejected as e:
         print(f"  API error: {e}")
-        return []
+        return iter(())
+    if words is None:
+        return iter(())  # Gave up (already logged)
+
+    cache.put(url, words)
+    return filter(is_valid_candidate, words)
 
-def search_by_pattern(pattern: str) -> List[str]:
+async def search_by_pattern(session: aiohttp.ClientSession, cache: DatamuseCache, pattern: str) -> Iterator[str]:
     """Search for words matching a pattern (? = single letter)"""
-    return query_datamuse({'sp': pattern})
+    return await query_datamuse(session, cache, {'sp': pattern})
 
-def search_by_meaning(hint: str) -> List[str]:
+async def search_by_meaning(session: aiohttp.ClientSession, cache: DatamuseCache, hint: str) -> Iterator[str]:
     """Search for words related to a meaning/topic"""
-    return query_datamuse({'ml': hint})
+    return await query_datamuse(session, cache, {'ml': hint})
 
-def search_by_rhyme(word: str) -> List[str]:
+async def search_by_rhyme(session: aiohttp.ClientSession, cache: DatamuseCache, word: str) -> Iterator[str]:
     """Search for words that rhyme with given word"""
-    return query_datamuse({'rel_rhy': word})
+    return await query_datamuse(session, cache, {'rel_rhy': word})
 
-def search_by_sound(word: str) -> List[str]:
+async def search_by_sound(session: aiohttp.ClientSession, cache: DatamuseCache, word: str) -> Iterator[str]:
     """Search for words that sound like given word"""
-    return query_datamuse({'sl': word})
+    return await query_datamuse(session, cache, {'sl': word})
 
-def search_frequent() -> List[str]:
+async def search_frequent(session: aiohttp.ClientSession, cache: DatamuseCache) -> Set[str]:
     """Get frequently used 5-letter words"""
     # Datamuse doesn't have a direct frequency endpoint, but we can
     # search for words that complete common patterns
@@ -92,13 +309,13 @@ def search_frequent() -> List[str]:
               'fl', 'pl', 'bl', 'cl', 'sp', 'sw', 'sc', 'sk', 'sl', 'sm',
               'sn', 'qu', 'dr', 'fr', 'wr']
 
-    for start in starts:
-        pattern = f"{start}???"
-        results = search_by_pattern(pattern)
-        words.update(results)
-        time.sleep(0.1)  # Rate limiting
+    results = await asyncio.gather(
+        *(search_by_pattern(session, cache, f"{start}???") for start in starts)
+    )
+    for result in results:
+        words.update(result)
 
-    return list(words)
+    return words
 
 # ============================================================================
 # CATEGORY-BASED SEARCHES
@@ -122,21 +339,26 @@ CATEGORIES = {
     'jobs': ['job', 'profession', 'worker', 'occupation'],
 }
 
-def search_categories() -> Dict[str, List[str]]:
-    """Search for words in common categories"""
-    results = {}
+async def search_category(session: aiohttp.ClientSession, cache: DatamuseCache, hints: List[str]) -> Set[str]:
+    """Search all hints for a single category"""
+    category_words = set()
+
+    results = await asyncio.gather(*(search_by_meaning(session, cache, hint) for hint in hints))
+    for words in results:
+        category_words.update(words)
 
-    for category, hints in CATEGORIES.items():
-        print(f"  Searching category: {category}")
-        category_words = set()
+    return category_words
 
-        for hint in hints:
-            words = search_by_meaning(hint)
-            category_words.update(words)
-            time.sleep(0.1)  # Rate limiting
+async def search_categories(session: aiohttp.ClientSession, cache: DatamuseCache) -> Dict[str, Set[str]]:
+    """Search for words in common categories"""
+    # All categories are fetched concurrently; report in definition order
+    category_words = await asyncio.gather(
+        *(search_category(session, cache, hints) for hints in CATEGORIES.values())
+    )
+    results = dict(zip(CATEGORIES.keys(), category_words))
 
-        results[category] = list(category_words)
-        print(f"    Found {len(category_words)} words")
+    for category, words in results.items():
+        print(f"  Category {category}: found {len(words)} words")
 
     return results
 
@@ -144,7 +366,7 @@ def search_categories() -> Dict[str, List[str]]:
 # COMMON WORD PATTERNS
 # ============================================================================
 
-def search_common_patterns() -> List[str]:
+async def search_common_patterns(session: aiohttp.ClientSession, cache: DatamuseCache) -> Set[str]:
     """Search for words with common English patterns"""
     words = set()
 
@@ -161,18 +383,19 @@ def search_common_patterns() -> List[str]:
     ]
 
     print("  Searching common patterns...")
-    for pattern in patterns:
-        results = search_by_pattern(pattern)
-        words.update(results)
-        time.sleep(0.1)
+    results = await asyncio.gather(
+        *(search_by_pattern(session, cache, pattern) for pattern in patterns)
+    )
+    for result in results:
+        words.update(result)
 
-    return list(words)
+    return words
 
 # ============================================================================
 # RHYME-BASED DISCOVERY
 # ============================================================================
 
-def search_rhymes() -> List[str]:
+async def search_rhymes(session: aiohttp.ClientSession, cache: DatamuseCache) -> Set[str]:
     """Find words by rhyming with common words"""
     words = set()
 
@@ -191,12 +414,13 @@ def search_rhymes() -> List[str]:
     ]
 
     print("  Searching rhyme families...")
-    for seed in seed_words:
-        results = search_by_rhyme(seed)
-        words.update(results)
-        time.sleep(0.1)
+    results = await asyncio.gather(
+        *(search_by_rhyme(session, cache, seed) for seed in seed_words)
+    )
+    for result in results:
+        words.update(result)
 
-    return list(words)
+    return words
 
 # ============================================================================
 # MANUAL ALLOWLIST - Words we know should exist
@@ -224,17 +448,17 @@ MANUAL_CANDIDATES = [
     'ANIME', 'MANGA', 'SUSHI', 'RAMEN', 'TOFU', 'WASABI',
 ]
 
+MANUAL_UPPER = frozenset(w.upper() for w in MANUAL_CANDIDATES)
+
 # ============================================================================
 # FILTERING
 # ============================================================================
 
-# Words that look valid but shouldn't be included
-REJECT_PATTERNS = [
-    r'^[BCDFGHJKLMNPQRSTVWXYZ]{5}$',  # All consonants
-    r'^[AEIOU]{5}$',  # All vowels (unlikely to be real)
-]
+# Vowel lookup indexed by ord(char): words with 0 vowels (all consonants)
+# or 5 vowels (unlikely to be real) are rejected
+VOWEL_TBL = bytes(1 if chr(i) in 'AEIOU' else 0 for i in range(256))
 
-REJECT_WORDS = {
+REJECT_WORDS = frozenset({
     # Offensive
     'SLUTS', 'WHORE', 'BITCH', 'CUNTS', 'FUCKS', 'SHITS', 'NIGER',
     # Proper nouns (countries, names) - we have separate lists for these
@@ -242,24 +466,23 @@ REJECT_WORDS = {
     'JAMES', 'DAVID', 'SARAH', 'EMILY', 'MARIA',
     # Obscure/archaic
     'AALII', 'AARGH', 'ADIEU',
-}
+})
 
 def is_valid_candidate(word: str) -> bool:
-    """Check if word is a valid candidate"""
-    word = word.upper()
-
+    """Check if word is a valid candidate (callers must pass uppercase words)"""
     # Must be exactly 5 letters
     if len(word) != 5:
         return False
 
-    # Must be alphabetic
-    if not word.isalpha():
+    # Must be alphabetic A-Z (also keeps ord() within VOWEL_TBL)
+    if not (word.isascii() and word.isalpha()):
         return False
 
-    # Check reject patterns
-    for pattern in REJECT_PATTERNS:
-        if re.match(pattern, word):
-            return False
+    # Reject all-consonant / all-vowel words
+    vowels = (VOWEL_TBL[ord(word[0])] + VOWEL_TBL[ord(word[1])] + VOWEL_TBL[ord(word[2])]
+              + VOWEL_TBL[ord(word[3])] + VOWEL_TBL[ord(word[4])])
+    if vowels == 0 or vowels == 5:
+        return False
 
     # Check reject list
     if word in REJECT_WORDS:
@@ -271,7 +494,13 @@ def is_valid_candidate(word: str) -> bool:
 # MAIN
 # ============================================================================
 
-def main():
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Find common 5-letter words missing from our word list")
+    parser.add_argument('--refresh', action='store_true',
+                        help="ignore cached Datamuse responses and refetch everything")
+    return parser.parse_args()
+
+async def main(refresh: bool = False):
     print("=" * 70)
     print("MISSING WORDS FINDER")
     print("=" * 70)
@@ -284,37 +513,42 @@ def main():
 
     # 1. Manual allowlist
     print("\n[1/5] Adding manual candidates...")
-    manual = [w.upper() for w in MANUAL_CANDIDATES if is_valid_candidate(w)]
+    manual = [w for w in MANUAL_UPPER if is_valid_candidate(w)]
     all_candidates.update(manual)
     print(f"  Added {len(manual)} manual candidates")
 
-    # 2. Category searches
-    print("\n[2/5] Searching by category...")
-    category_results = search_categories()
-    for cat, words in category_results.items():
-        valid = [w for w in words if is_valid_candidate(w)]
-        all_candidates.update(valid)
-
-    # 3. Common patterns
-    print("\n[3/5] Searching common patterns...")
-    pattern_words = search_common_patterns()
-    valid_patterns = [w for w in pattern_words if is_valid_candidate(w)]
-    all_candidates.update(valid_patterns)
-    print(f"  Found {len(valid_patterns)} pattern words")
-
-    # 4. Rhyme families
-    print("\n[4/5] Searching rhyme families...")
-    rhyme_words = search_rhymes()
-    valid_rhymes = [w for w in rhyme_words if is_valid_candidate(w)]
-    all_candidates.update(valid_rhymes)
-    print(f"  Found {len(valid_rhymes)} rhyme words")
-
-    # 5. Frequent word patterns
-    print("\n[5/5] Searching frequent patterns...")
-    freq_words = search_frequent()
-    valid_freq = [w for w in freq_words if is_valid_candidate(w)]
-    all_candidates.update(valid_freq)
-    print(f"  Found {len(valid_freq)} frequent words")
+    with shelve.open(str(CACHE_FILE)) as shelf:
+        cache = DatamuseCache(shelf, refresh=refresh)
+
+        # One pooled session for every Datamuse request (keep-alive + DNS cache).
+        # Pool is as large as the limiter's ceiling so requests never queue for a
+        # connection - that wait would count against the timeout and shrink the limit
+        connector = aiohttp.TCPConnector(limit=DATAMUSE_CONCURRENCY_MAX, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            # 2. Category searches
+            print("\n[2/5] Searching by category...")
+            # Datamuse results are already validated by query_datamuse
+            category_results = await search_categories(session, cache)
+            for cat, words in category_results.items():
+                all_candidates.update(words)
+
+            # 3. Common patterns
+            print("\n[3/5] Searching common patterns...")
+            pattern_words = await search_common_patterns(session, cache)
+            all_candidates.update(pattern_words)
+            print(f"  Found {len(pattern_words)} pattern words")
+
+            # 4. Rhyme families
+            print("\n[4/5] Searching rhyme families...")
+            rhyme_words = await search_rhymes(session, cache)
+            all_candidates.update(rhyme_words)
+            print(f"  Found {len(rhyme_words)} rhyme words")
+
+            # 5. Frequent word patterns
+            print("\n[5/5] Searching frequent patterns...")
+            freq_words = await search_frequent(session, cache)
+            all_candidates.update(freq_words)
+            print(f"  Found {len(freq_words)} frequent words")
 
     # Filter out words we already have
     print("\n" + "=" * 70)
@@ -323,30 +557,23 @@ def main():
 
     missing = all_candidates - current_words
     missing_sorted = sorted(missing)
+    already_present = len(all_candidates) - len(missing)
 
     print(f"\nTotal candidates found: {len(all_candidates)}")
-    print(f"Already in word list: {len(all_candidates & current_words)}")
+    print(f"Already in word list: {already_present}")
     print(f"Potentially missing: {len(missing)}")
 
     # Categorize missing words
     print(f"\n--- MISSING WORDS ({len(missing_sorted)}) ---\n")
 
-    # Group by first letter for easier review
-    by_letter = {}
-    for word in missing_sorted:
-        letter = word[0]
-        if letter not in by_letter:
-            by_letter[letter] = []
-        by_letter[letter].append(word)
-
-    for letter in sorted(by_letter.keys()):
-        words = by_letter[letter]
+    # Group by first letter for easier review (list is already sorted)
+    for letter, words in groupby(missing_sorted, key=itemgetter(0)):
         print(f"{letter}: {', '.join(words)}")
 
     # Write to file
     print(f"\n--- Writing to {OUTPUT_FILE.name} ---")
 
-    output_content = f'''/**
+    header = f'''/**
  * MISSING_CANDIDATES
  *
  * Potential words to add to the master word list.
@@ -362,15 +589,16 @@ def main():
 export const MISSING_CANDIDATES: string[] = [
 '''
 
-    output_content += ',\n'.join(f'  "{w}"' for w in missing_sorted)
-    output_content += ',\n];\n'
-
-    OUTPUT_FILE.write_text(output_content)
+    # Stream line by line rather than building the whole file in memory
+    with OUTPUT_FILE.open('w', encoding='utf-8') as f:
+        f.write(header)
+        f.writelines(f'  "{w}",\n' for w in missing_sorted)
+        f.write('];\n')
     print(f"Wrote {len(missing_sorted)} candidates to {OUTPUT_FILE.name}")
 
     # Show some highlights
     print("\n--- NOTABLE MISSING WORDS ---")
-    notable = [w for w in missing_sorted if w in [x.upper() for x in MANUAL_CANDIDATES]]
+    notable = [w for w in missing_sorted if w in MANUAL_UPPER]
     if notable:
         print(f"From manual list: {', '.join(notable[:20])}")
 
@@ -379,4 +607,5 @@ export const MISSING_CANDIDATES: string[] = [
     print("=" * 70)
 
 if __name__ == '__main__':
-    main()
+    args = parse_args()
+    asyncio.run(main(refresh=args.refresh))
@@ -19,8 +19,10 @@ Usage:
 
 import re
 import json
+import heapq
+import functools
 from pathlib import Path
-from typing import Set, List, Tuple
+from typing import Set, List, Tuple, Dict, Iterable, Iterator
 from wordfreq import zipf_frequency, iter_wordlist
 
 # ============================================================================
@@ -53,13 +55,13 @@ TARGET_ANSWER_SIZE = 3500  # ~3-4k
 # ============================================================================
 
 # Offensive words
-OFFENSIVE_BLACKLIST = {
+OFFENSIVE_BLACKLIST = frozenset({
     'SLUTS', 'WHORE', 'BITCH', 'COCKS', 'CUNTS', 'FUCKS', 'SHITS',
     'PRICK', 'PUSSY', 'TARDS', 'BITTY', 'CRAPS', 'HELLS',
-}
+})
 
 # Proper nouns (names, places, brands, months, acronyms/initialisms)
-PROPER_NOUN_BLACKLIST = {
+PROPER_NOUN_BLACKLIST = frozenset({
     'JESUS', 'CHINA', 'INDIA', 'SPAIN', 'ITALY', 'PARIS', 'TOKYO',
     'JAMES', 'JONES', 'SMITH', 'BROWN', 'DAVIS', 'MARCH', 'APRIL',
     'ALICE', 'BOBBY', 'KAREN', 'MASON', 'LOGAN', 'LUCAS', 'HENRY',
@@ -70,10 +72,10 @@ PROPER_NOUN_BLACKLIST = {
     'HTTPS', 'NORAD', 'LGBTQ',
     # Names and brand names
     'AAMIR', 'AADMI', 'XANAX',
-}
+})
 
 # Known Scrabble garbage (explicitly bad words to double-check)
-SCRABBLE_GARBAGE = {
+SCRABBLE_GARBAGE = frozenset({
     'AALII', 'AAHED', 'AARGH', 'AARTI', 'ABACA', 'ABACI', 'ABAFT',
     'ABAHT', 'ABAKA', 'ABAMP', 'ABAND', 'ABASK', 'ABAYA', 'ABCEE',
     'ABEAM', 'ABEAR', 'ABELE', 'ABENG', 'ABJAD', 'ABJUD', 'ABLET',
@@ -88,7 +90,10 @@ SCRABBLE_GARBAGE = {
     'AAAAH', 'ABABA',
     # Roman numerals
     'XVIII', 'XXIII',
-}
+})
+
+# Union of all blacklists - one membership test on the common (accepted) path
+ALL_BLACKLIST = OFFENSIVE_BLACKLIST | PROPER_NOUN_BLACKLIST | SCRABBLE_GARBAGE
 
 # Crypto/Farcaster terminology (whitelist - always include regardless of frequency)
 CRYPTO_WHITELIST = {
@@ -107,6 +112,12 @@ CRYPTO_WHITELIST = {
 # HELPER FUNCTIONS
 # ============================================================================
 
+# Bound fullmatch of a precompiled pattern - cheaper than re.match per word
+WORD5_RE = re.compile(r'[a-z]{5}').fullmatch
+
+# Memoized Zipf scores, shared by the guess, answer and plural passes
+FREQ: Dict[str, float] = {}
+
 def load_word_list_from_ts(filepath: Path) -> Set[str]:
     """Extract words from TypeScript export file"""
     content = filepath.read_text()
@@ -123,24 +134,31 @@ def load_word_list_from_ts(filepath: Path) -> Set[str]:
 
     return set(words)
 
-def load_all_five_letter_words_from_wordfreq() -> Set[str]:
-    """Load all 5-letter English words from wordfreq vocabulary"""
-    five_letter_words = set()
+def iter_source_words() -> Iterator[str]:
+    """
+    Stream all 5-letter English words from wordfreq vocabulary, followed by
+    any crypto/Farcaster whitelist words wordfreq doesn't know.
+    Each word is yielded once, uppercase.
+    """
+    missing_crypto = set(CRYPTO_WHITELIST)
 
     for word in iter_wordlist('en'):
-        # Only include 5-letter words with only letters
-        if len(word) == 5 and re.match(r'^[a-z]{5}$', word):
-            five_letter_words.add(word.upper())
+        # Only include 5-letter words with only letters (length check first
+        # rejects most of the vocabulary without touching the regex)
+        if len(word) == 5 and WORD5_RE(word):
+            word = word.upper()
+            missing_crypto.discard(word)
+            yield word
 
-    return five_letter_words
+    yield from sorted(missing_crypto)
 
 def write_word_list_to_ts(filepath: Path, words: List[str], var_name: str) -> None:
     """Write words to TypeScript export file"""
-    content = f"export const {var_name}: string[] = [\n"
-    content += ',\n'.join(f'  "{word}"' for word in words)
-    content += '\n];\n'
+    with filepath.open('w', encoding='utf-8') as f:
+        f.write(f"export const {var_name}: string[] = [\n")
+        f.write(',\n'.join(f'  "{word}"' for word in words))
+        f.write('\n];\n')
 
-    filepath.write_text(content)
     print(f"✅ Written {len(words)} words to {filepath.name}")
 
 def is_offensive(word: str) -> bool:
@@ -155,6 +173,10 @@ def is_scrabble_garbage(word: str) -> bool:
     """Check if word is known Scrabble garbage"""
     return word in SCRABBLE_GARBAGE
 
+def is_valid_format(word: str) -> bool:
+    """Check if word is exactly 5 uppercase A-Z letters"""
+    return len(word) == 5 and word.isascii() and word.isalpha() and word.isupper()
+
 def is_crypto_term(word: str) -> bool:
     """Check if word is a whitelisted crypto/Farcaster term"""
     return word in CRYPTO_WHITELIST
@@ -165,10 +187,27 @@ def is_roman_numeral(word: str) -> bool:
     return bool(re.match(r'^[IVXLCDM]+$', word))
 
 def get_frequency_score(word: str) -> float:
-    """Get Zipf frequency score for a word"""
-    # Wordfreq expects lowercase
-    return zipf_frequency(word.lower(), 'en')
-
+    """Get Zipf frequency score for a word (each word is looked up once)"""
+    freq = FREQ.get(word)
+    if freq is None:
+        # Wordfreq expects lowercase
+        freq = FREQ[word] = zipf_frequency(word.lower(), 'en')
+    return freq
+
+# Non-plural S words (str.endswith takes a tuple)
+NON_PLURAL_ENDINGS = ('SS', 'US', 'IS', 'AS')
+
+# Specific non-plural S words
+NON_PLURAL_WORDS = frozenset({
+    'BRASS', 'CHESS', 'CLASS', 'CROSS', 'DRESS', 'GLASS', 'GRASS',
+    'GUESS', 'BLESS', 'BLISS', 'ABYSS', 'TRUSS', 'FLOSS', 'GLOSS',
+    'ALIAS', 'ATLAS', 'BASIS', 'OASIS', 'VIRUS', 'FOCUS', 'GENUS',
+    'MINUS', 'NEXUS', 'BONUS', 'GROSS', 'LOSS', 'MASS', 'MISS',
+    'PASS', 'BOSS', 'TOSS', 'KISS', 'PRESS', 'STRESS', 'CHAOS',
+    'CRASS',  # Make sure CRASS is not considered a plural!
+})
+
+@functools.lru_cache(maxsize=None)
 def is_likely_plural(word: str) -> bool:
     """
     Heuristic to detect likely plurals.
@@ -177,23 +216,10 @@ def is_likely_plural(word: str) -> bool:
     if not word.endswith('S'):
         return False
 
-    # Non-plural S words
-    non_plural_endings = {'SS', 'US', 'IS', 'AS'}
-    for ending in non_plural_endings:
-        if word.endswith(ending):
-            return False
-
-    # Specific non-plural S words
-    non_plural_words = {
-        'BRASS', 'CHESS', 'CLASS', 'CROSS', 'DRESS', 'GLASS', 'GRASS',
-        'GUESS', 'BLESS', 'BLISS', 'ABYSS', 'TRUSS', 'FLOSS', 'GLOSS',
-        'ALIAS', 'ATLAS', 'BASIS', 'OASIS', 'VIRUS', 'FOCUS', 'GENUS',
-        'MINUS', 'NEXUS', 'BONUS', 'GROSS', 'LOSS', 'MASS', 'MISS',
-        'PASS', 'BOSS', 'TOSS', 'KISS', 'PRESS', 'STRESS', 'CHAOS',
-        'CRASS',  # Make sure CRASS is not considered a plural!
-    }
+    if word.endswith(NON_PLURAL_ENDINGS):
+        return False
 
-    if word in non_plural_words:
+    if word in NON_PLURAL_WORDS:
         return False
 
     # If it ends in S and isn't in the exceptions, likely a plural
@@ -211,7 +237,7 @@ def is_likely_plural(word: str) -> bool:
 # MAIN FILTERING LOGIC
 # ============================================================================
 
-def generate_guess_words(source_words: Set[str]) -> List[str]:
+def generate_guess_words(source_words: Iterable[str]) -> List[str]:
     """
     Generate GUESS_WORDS_CLEAN using frequency-based filtering.
 
@@ -225,15 +251,8 @@ def generate_guess_words(source_words: Set[str]) -> List[str]:
     """
     print("\n=== GENERATING GUESS_WORDS_CLEAN ===\n")
 
-    candidates_with_freq = []
-
-    for word in source_words:
-        freq = get_frequency_score(word)
-        candidates_with_freq.append((word, freq))
-
-    print(f"Total candidates: {len(candidates_with_freq)}")
-
-    # Filter
+    # Single pass over the source stream: filter, then score survivors
+    total_candidates = 0
     valid_words = []
     rejected = {
         'offensive': 0,
@@ -243,18 +262,17 @@ def generate_guess_words(source_words: Set[str]) -> List[str]:
         'too_rare': 0,
     }
 
-    for word, freq in candidates_with_freq:
-        # Basic blacklist checks
-        if is_offensive(word):
-            rejected['offensive'] += 1
-            continue
-
-        if is_proper_noun(word):
-            rejected['proper_noun'] += 1
-            continue
-
-        if is_scrabble_garbage(word):
-            rejected['scrabble_garbage'] += 1
+    for word in source_words:
+        total_candidates += 1
+
+        # Basic blacklist checks (only disambiguate on rejection, for counts)
+        if word in ALL_BLACKLIST:
+            if is_offensive(word):
+                rejected['offensive'] += 1
+            elif is_proper_noun(word):
+                rejected['proper_noun'] += 1
+            else:
+                rejected['scrabble_garbage'] += 1
             continue
 
         if is_roman_numeral(word):
@@ -262,21 +280,21 @@ def generate_guess_words(source_words: Set[str]) -> List[str]:
             continue
 
         # Frequency check (crypto terms bypass this check)
+        freq = get_frequency_score(word)
         if freq < MIN_ZIPF_GUESS and not is_crypto_term(word):
             rejected['too_rare'] += 1
             continue
 
         valid_words.append((word, freq))
 
-    # Sort by frequency (descending) then alphabetically
-    valid_words.sort(key=lambda x: (-x[1], x[0]))
-
-    # Take top TARGET_GUESS_SIZE
-    final_words = [word for word, freq in valid_words[:TARGET_GUESS_SIZE]]
+    # Take top TARGET_GUESS_SIZE by frequency (descending) then alphabetically,
+    # without sorting the full candidate list
+    top_words = heapq.nsmallest(TARGET_GUESS_SIZE, valid_words, key=lambda x: (-x[1], x[0]))
 
     # Sort alphabetically for output
-    final_words.sort()
+    final_words = sorted(word for word, freq in top_words)
 
+    print(f"Total candidates: {total_candidates}")
     print(f"Filtering results:")
     print(f"  - Offensive: {rejected['offensive']}")
     print(f"  - Proper nouns: {rejected['proper_noun']}")
@@ -333,14 +351,11 @@ def generate_answer_words(guess_words: List[str]) -> List[str]:
 
         valid_answers.append((word, freq))
 
-    # Sort by frequency (descending)
-    valid_answers.sort(key=lambda x: (-x[1], x[0]))
-
-    # Take top TARGET_ANSWER_SIZE
-    final_words = [word for word, freq in valid_answers[:TARGET_ANSWER_SIZE]]
+    # Take top TARGET_ANSWER_SIZE by frequency (descending) then alphabetically
+    top_answers = heapq.nsmallest(TARGET_ANSWER_SIZE, valid_answers, key=lambda x: (-x[1], x[0]))
 
     # Sort alphabetically for output
-    final_words.sort()
+    final_words = sorted(word for word, freq in top_answers)
 
     print(f"Filtering results:")
     print(f"  - Plurals excluded: {rejected['plural']}")
@@ -351,58 +366,68 @@ def generate_answer_words(guess_words: List[str]) -> List[str]:
 
     return final_words
 
+def check_word_list(words: List[str], name: str, errors: List[str]) -> Set[str]:
+    """
+    Check format, duplicates and alphabetical order in a single pass.
+    Appends any problems to errors and returns the words as a set.
+    """
+    seen = set()
+    prev = ''
+    has_duplicates = False
+    is_unsorted = False
+
+    for word in words:
+        if not is_valid_format(word):
+            errors.append(f"Invalid format: {word}")
+        if word in seen:
+            has_duplicates = True
+        else:
+            seen.add(word)
+        if word < prev:
+            is_unsorted = True
+        prev = word
+
+    if has_duplicates:
+        errors.append(f"{name} has duplicates")
+    if is_unsorted:
+        errors.append(f"{name} not alphabetically sorted")
+
+    return seen
+
 def validate_dictionaries(guess_words: List[str], answer_words: List[str]) -> None:
     """Validate generated dictionaries"""
     print("\n=== VALIDATION ===\n")
 
     errors = []
 
-    # Check format
-    for word in guess_words + answer_words:
-        if not re.match(r'^[A-Z]{5}$', word):
-            errors.append(f"Invalid format: {word}")
-
-    # Check no duplicates
-    if len(set(guess_words)) != len(guess_words):
-        errors.append("GUESS_WORDS_CLEAN has duplicates")
-
-    if len(set(answer_words)) != len(answer_words):
-        errors.append("ANSWER_WORDS_EXPANDED has duplicates")
+    # Format, duplicates and order - one pass per list
+    guess_set = check_word_list(guess_words, 'GUESS_WORDS_CLEAN', errors)
+    answer_set = check_word_list(answer_words, 'ANSWER_WORDS_EXPANDED', errors)
 
     # Check subset relationship
-    guess_set = set(guess_words)
-    for word in answer_words:
-        if word not in guess_set:
-            errors.append(f'Answer word "{word}" not in guess words')
-
-    # Check alphabetical order
-    if guess_words != sorted(guess_words):
-        errors.append("GUESS_WORDS_CLEAN not alphabetically sorted")
-
-    if answer_words != sorted(answer_words):
-        errors.append("ANSWER_WORDS_EXPANDED not alphabetically sorted")
+    errors.extend(f'Answer word "{word}" not in guess words' for word in sorted(answer_set - guess_set))
 
     # Specific regression tests
     print("Regression tests:")
 
     # CRASS must be present
-    if 'CRASS' in guess_words:
+    if 'CRASS' in guess_set:
         print("  ✅ CRASS in GUESS_WORDS_CLEAN")
     else:
         errors.append("❌ CRASS missing from GUESS_WORDS_CLEAN")
 
-    if 'CRASS' in answer_words:
+    if 'CRASS' in answer_set:
         print("  ✅ CRASS in ANSWER_WORDS_EXPANDED")
     else:
         print("  ⚠️  CRASS not in ANSWER_WORDS_EXPANDED (may be filtered as uncommon)")
 
     # MENIL must NOT be present
-    if 'MENIL' not in guess_words:
+    if 'MENIL' not in guess_set:
         print("  ✅ MENIL excluded from GUESS_WORDS_CLEAN")
     else:
         errors.append("❌ MENIL present in GUESS_WORDS_CLEAN")
 
-    if 'MENIL' not in answer_words:
+    if 'MENIL' not in answer_set:
         print("  ✅ MENIL excluded from ANSWER_WORDS_EXPANDED")
     else:
         errors.append("❌ MENIL present in ANSWER_WORDS_EXPANDED")
@@ -411,7 +436,7 @@ def validate_dictionaries(guess_words: List[str], answer_words: List[str]) -> No
     normal_words = ['CLASS', 'GLASS', 'GRASS', 'PRESS', 'CROSS', 'TRUST',
                    'SHRED', 'SPLIT', 'CRISP', 'SHARP', 'SWEET']
 
-    missing_normal = [w for w in normal_words if w not in guess_words]
+    missing_normal = [w for w in normal_words if w not in guess_set]
     if missing_normal:
         print(f"  ⚠️  Normal words missing: {', '.join(missing_normal)}")
     else:
@@ -419,7 +444,7 @@ def validate_dictionaries(guess_words: List[str], answer_words: List[str]) -> No
 
     # Garbage words
     garbage_words = ['AALII', 'AARGH', 'XYSTI', 'YEXED', 'QANAT']
-    present_garbage = [w for w in garbage_words if w in guess_words]
+    present_garbage = [w for w in garbage_words if w in guess_set]
     if present_garbage:
         errors.append(f"❌ Garbage words present: {', '.join(present_garbage)}")
     else:
@@ -451,18 +476,13 @@ def main():
     print("FREQUENCY-BASED DICTIONARY GENERATOR - Milestone 4.13 (Corrected)")
     print("=" * 80)
 
-    # Load source words from wordfreq vocabulary (not Wordle lists)
-    print("\n=== LOADING SOURCE WORDS FROM WORDFREQ ===\n")
-    all_source_words = load_all_five_letter_words_from_wordfreq()
-
-    # Add crypto/Farcaster whitelist words (some may not be in wordfreq)
-    all_source_words.update(CRYPTO_WHITELIST)
-
-    print(f"Loaded {len(all_source_words)} five-letter words from wordfreq vocabulary")
+    # Source words are streamed from wordfreq vocabulary (not Wordle lists),
+    # plus crypto/Farcaster whitelist words (some may not be in wordfreq)
+    print("\n=== STREAMING SOURCE WORDS FROM WORDFREQ ===\n")
     print(f"Added {len(CRYPTO_WHITELIST)} crypto/Farcaster terms to whitelist")
 
     # Generate dictionaries
-    guess_words = generate_guess_words(all_source_words)
+    guess_words = generate_guess_words(iter_source_words())
     answer_words = generate_answer_words(guess_words)
 
     # Validate